@@ -13,8 +13,12 @@ Echo CSV format typically requires:
 
 import csv
 import argparse
+from itertools import repeat
 from typing import List, Dict, Tuple
 
+# Code point of row 'A', hoisted out of the per-well conversions
+_ORD_A = ord('A')
+
 
 def well_to_row_col(well: str) -> Tuple[int, int]:
     """
@@ -26,7 +30,7 @@ def well_to_row_col(well: str) -> Tuple[int, int]:
     Returns:
         Tuple of (row_index, col_index) where row 'A' = 0, col '1' = 0
     """
-    row = ord(well[0].upper()) - ord('A')
+    row = ord(well[0].upper()) - _ORD_A
     col = int(well[1:]) - 1
     return row, col
 
@@ -43,7 +47,21 @@ def row_col_to_well(row: int, col: int, plate_format: int = 384) -> str:
     Returns:
         Well notation like 'A1'
     """
-    return f"{chr(ord('A') + row)}{col + 1}"
+    return f"{chr(_ORD_A + row)}{col + 1}"
+
+
+def _well_positions(num_rows: int, num_cols: int) -> Tuple[str, ...]:
+    """Return the row-major well names of a num_rows x num_cols plate."""
+    return tuple(
+        row_col_to_well(row, col)
+        for row in range(num_rows)
+        for col in range(num_cols)
+    )
+
+
+# Well names for each plate format, built once at import
+_WELLS384 = _well_positions(16, 24)
+_WELLS96 = _well_positions(8, 12)
 
 
 def generate_384_well_positions() -> List[str]:
@@ -54,11 +72,7 @@ def generate_384_well_positions() -> List[str]:
     Returns:
         List of well positions in order
     """
-    wells = []
-    for row in range(16):  # A-P
-        for col in range(24):  # 1-24
-            wells.append(row_col_to_well(row, col))
-    return wells
+    return list(_WELLS384)
 
 
 def generate_96_well_positions() -> List[str]:
@@ -69,11 +83,7 @@ def generate_96_well_positions() -> List[str]:
     Returns:
         List of well positions in order
     """
-    wells = []
-    for row in range(8):  # A-H
-        for col in range(12):  # 1-12
-            wells.append(row_col_to_well(row, col, 96))
-    return wells
+    return list(_WELLS96)
 
 
 def generate_echo_csv(
@@ -102,9 +112,7 @@ def generate_echo_csv(
         writer = csv.writer(f)
         # Echo CSV header
         writer.writerow(['Source Well', 'Destination Well', 'Transfer Volume'])
-        
-        for src, dst in zip(source_wells, destination_wells):
-            writer.writerow([src, dst, transfer_volume_nl])
+        writer.writerows(zip(source_wells, destination_wells, repeat(transfer_volume_nl)))
     
     print(f"Generated Echo CSV: {output_file}")
     print(f"  Transfers: {len(source_wells)}")
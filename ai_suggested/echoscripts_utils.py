@@ -5,21 +5,29 @@ primer selection, and transfer CSV generation. It aims to preserve the original
 behaviour while making it easier to call from notebooks or scripts.
 """
 from dataclasses import dataclass
+import csv
 import numpy as np
 import pandas as pd
 import string
 from typing import List, Tuple
 
 
+# 16x24 grid of well names A1..P24, built once at import by broadcasting the
+# row letters against the column numbers.
+_WELLS384 = np.char.add(
+    np.array(list(string.ascii_uppercase[:16]))[:, None],
+    np.arange(1, 25).astype('U2')[None, :],
+)
+
+
 def wells384_list() -> List[str]:
     """Return a flat list of 384-well names A1..P24 in row-major order."""
-    return [r + str(c) for r in string.ascii_uppercase[:16] for c in range(1, 25)]
+    return _WELLS384.ravel().tolist()
 
 
 def wells384_grid() -> np.ndarray:
     """Return a 16x24 numpy array of well names."""
-    wells = wells384_list()
-    return np.reshape(np.array(wells), (16, 24))
+    return _WELLS384.copy()
 
 
 def split_primers_from_grid(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -33,12 +41,47 @@ def split_primers_from_grid(grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     return fprimers_full, rprimers_full
 
 
+def _legacy_pairs(rs: np.random.RandomState, nf: int, nr: int, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Pick `n` distinct (forward, reverse) index pairs the way the notebooks did.
+
+    Replays the notebooks' exact sequence of randint calls (re-drawing on a
+    repeated pair or iforward == ireverse) so seeded plates are unchanged.
+    """
+    ifwd = np.empty(n, dtype=np.intp)
+    irev = np.empty(n, dtype=np.intp)
+    covered = set()
+
+    # start with a random pair
+    iforward = rs.randint(0, nf)
+    ireverse = iforward
+    while ireverse == iforward:
+        ireverse = rs.randint(0, nr)
+    currtup = (iforward, ireverse)
+
+    for k in range(n):
+        while currtup in covered:
+            iforward = rs.randint(0, nf)
+            ireverse = iforward
+            while ireverse == iforward:
+                ireverse = rs.randint(0, nr)
+            currtup = (iforward, ireverse)
+        covered.add(currtup)
+        ifwd[k] = iforward
+        irev[k] = ireverse
+    return ifwd, irev
+
+
 @dataclass
 class EchoTransferGenerator:
     randseed: int
     grid: np.ndarray = None
     fprimers_full: np.ndarray = None
     rprimers_full: np.ndarray = None
+    # True reproduces the notebooks' RandomState/randint draws, so a given
+    # randseed keeps giving the plate saved under its helloPrimersRand{randseed}
+    # filename. False uses the faster vectorized Generator draw, which yields a
+    # different plate for the same seed.
+    legacy_rng: bool = True
 
     def __post_init__(self):
         if self.grid is None:
@@ -56,6 +99,39 @@ class EchoTransferGenerator:
         rprimers = self.rprimers_full[offset:]
         return fprimers, rprimers
 
+    def _transfer_columns(self, volume_nl: int, use_seed: bool) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the Source Well, Destination Well and Volume columns as arrays.
+
+        Shared by generate_transfer_df and write_transfer_csv so both produce
+        the same pairing for a given seed.
+        """
+        fprimers, rprimers = self.sample_primers()
+        nf, nr = len(fprimers), len(rprimers)
+
+        seed = self.randseed if use_seed else None
+        if self.legacy_rng:
+            ifwd, irev = _legacy_pairs(np.random.RandomState(seed), nf, nr, 16 * 24)
+        else:
+            rng = np.random.default_rng(seed)
+            # encode each (forward, reverse) pair as iforward * nr + ireverse and
+            # draw all 384 distinct pairs in one go, excluding iforward == ireverse
+            codes = np.arange(nf * nr)
+            codes = codes[codes // nr != codes % nr]
+            pairs = rng.choice(codes, size=16 * 24, replace=False)
+            ifwd, irev = np.divmod(pairs, nr)
+
+        # gather all forward and reverse wells in one fancy index each, then
+        # interleave them so every destination well gets a fwd line then a rev line
+        fwd_wells = fprimers[ifwd]
+        rev_wells = rprimers[irev]
+        sourcewells = np.empty(2 * len(ifwd), dtype=np.result_type(fwd_wells, rev_wells))
+        sourcewells[0::2] = fwd_wells
+        sourcewells[1::2] = rev_wells
+        destwells = np.repeat(_WELLS384.ravel(), 2)
+        vols = np.full(len(sourcewells), volume_nl)
+
+        return sourcewells, destwells, vols
+
     def generate_transfer_df(self, volume_nl: int = 500, use_seed: bool = True) -> pd.DataFrame:
         """Generate a transfer dataframe with columns Source Well, Destination Well, Volume.
 
@@ -64,46 +140,23 @@ class EchoTransferGenerator:
         available pools, avoiding duplicates in the same order. Each pair
         contributes two transfer lines (fwd and rev) to the destination well.
         """
-        fprimers, rprimers = self.sample_primers()
-
-        if use_seed:
-            np.random.seed(self.randseed)
-
-        sourcewells = []
-        destwells = []
-        vols = []
-        covered_list = []
-
-        # start with a random pair
-        iforward = np.random.randint(0, len(fprimers))
-        ireverse = iforward
-        while ireverse == iforward:
-            ireverse = np.random.randint(0, len(rprimers))
-        currtup = (iforward, ireverse)
-
-        for row in range(16):
-            for col in range(24):
-                while currtup in covered_list:
-                    iforward = np.random.randint(0, len(fprimers))
-                    ireverse = iforward
-                    while ireverse == iforward:
-                        ireverse = np.random.randint(0, len(rprimers))
-                    currtup = (iforward, ireverse)
-                covered_list.append(currtup)
-
-                dest = string.ascii_uppercase[row] + str(col + 1)
-
-                sourcewells.append(fprimers[iforward])
-                destwells.append(dest)
-                vols.append(volume_nl)
-
-                sourcewells.append(rprimers[ireverse])
-                destwells.append(dest)
-                vols.append(volume_nl)
-
+        sourcewells, destwells, vols = self._transfer_columns(volume_nl, use_seed)
         df = pd.DataFrame({"Source Well": sourcewells, "Destination Well": destwells, "Volume": vols})
         return df
 
+    def write_transfer_csv(self, path: str, volume_nl: int = 500, use_seed: bool = True) -> None:
+        """Write the transfer table straight to a CSV file at `path`.
+
+        Produces the same file as generate_transfer_df(...).to_csv(path,
+        index=False, lineterminator='\\n') without building the intermediate
+        DataFrame. Lines always end in '\\n', whatever the platform.
+        """
+        sourcewells, destwells, vols = self._transfer_columns(volume_nl, use_seed)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(["Source Well", "Destination Well", "Volume"])
+            writer.writerows(zip(sourcewells, destwells, vols.tolist()))
+
 
 def join_transfer_with_barcodes(df_transfer: pd.DataFrame, df_barcodes: pd.DataFrame) -> pd.DataFrame:
     """Join transfer dataframe with barcode mapping, return cleaned joined frame.
@@ -111,10 +164,19 @@ def join_transfer_with_barcodes(df_transfer: pd.DataFrame, df_barcodes: pd.DataF
     Matches df_transfer.Source Well with df_barcodes.Storage and returns a
     dataframe with Destination Well, Direction (F/R) and Sequence (spaces removed).
     """
-    df_joined = pd.merge(df_transfer, df_barcodes, left_on='Source Well', right_on='Storage')
-    df_joined['Direction'] = df_joined['Sequence Name'].str.extract(r'([^\d])\d*$')
-    df_joined = df_joined.drop(columns=['Source Well', 'Volume', 'Well Position', 'Sequence Name', 'Storage'])
-    df_joined['Sequence'] = df_joined['Sequence'].str.replace(' ', '')
+    # many transfer lines map onto one barcode, so look each Source Well up in
+    # a Storage-indexed table rather than running a full merge
+    bc = df_barcodes.set_index('Storage')
+    if not bc.index.is_unique:
+        # same check as pd.merge(..., validate='many_to_one')
+        raise pd.errors.MergeError("Storage values in df_barcodes are not unique; not a many-to-one join")
+    # inner join: keep only transfers with a barcode, in their original order
+    df_joined = df_transfer[df_transfer['Source Well'].isin(bc.index)].reset_index(drop=True)
+    df_joined['Sequence'] = df_joined['Source Well'].map(bc['Sequence']).str.replace(' ', '', regex=False)
+    df_joined['Sequence Name'] = df_joined['Source Well'].map(bc['Sequence Name'])
+    # direction is the last character once the trailing digits are stripped
+    df_joined['Direction'] = df_joined['Sequence Name'].str.rstrip('0123456789').str[-1]
+    df_joined = df_joined.drop(columns=['Source Well', 'Volume', 'Sequence Name'])
     return df_joined
 
 
@@ -122,8 +184,24 @@ def pivot_barcodes(df_joined: pd.DataFrame) -> pd.DataFrame:
     """Pivot joined barcodes into table indexed by Destination Well with columns F and R.
 
     Returned frame has columns SampleID (Destination Well), FwIndex, RvIndex.
+    Rows keep the order of df_joined (A1, A2, ... for a generated plate).
     """
-    df_pivoted = df_joined.pivot(index='Destination Well', columns='Direction', values='Sequence').reset_index().reset_index(drop=True)
-    df_pivoted.columns = ['SampleID', 'FwIndex', 'RvIndex']
-    df_pivoted.set_index('SampleID', inplace=True)
+    # every destination well has exactly one F and one R line, so split on
+    # Direction and align the two halves on the well instead of pivoting;
+    # check that up front, as pivot would have refused such input
+    if df_joined['Direction'].isna().any():
+        raise ValueError("Direction is missing for some lines; expected 'F' or 'R'")
+    unknown = sorted(set(df_joined['Direction']) - {'F', 'R'})
+    if unknown:
+        raise ValueError(f"Direction must be 'F' or 'R'; found {unknown}")
+    duplicated = df_joined.duplicated(subset=['Destination Well', 'Direction'])
+    if duplicated.any():
+        wells = df_joined.loc[duplicated, 'Destination Well'].unique().tolist()
+        raise ValueError(f"Destination wells with more than one line per Direction: {wells}")
+
+    g = df_joined.set_index('Destination Well')
+    fw = g.loc[g['Direction'] == 'F', 'Sequence'].rename('FwIndex')
+    rv = g.loc[g['Direction'] == 'R', 'Sequence'].rename('RvIndex')
+    df_pivoted = pd.concat([fw, rv], axis=1)
+    df_pivoted.index.name = 'SampleID'
     return df_pivoted
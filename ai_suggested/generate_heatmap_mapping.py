@@ -23,6 +23,9 @@ import argparse
 from typing import List, Tuple, Dict
 import sys
 
+# Code point of row 'A', hoisted out of the per-well conversions
+_ORD_A = ord('A')
+
 
 def well_to_row_col(well: str) -> Tuple[str, int, int, int]:
     """
@@ -36,7 +39,7 @@ def well_to_row_col(well: str) -> Tuple[str, int, int, int]:
     """
     row_letter = well[0].upper()
     col_number = int(well[1:])
-    row_index = ord(row_letter) - ord('A')
+    row_index = ord(row_letter) - _ORD_A
     col_index = col_number - 1
     return row_letter, col_number, row_index, col_index
 
@@ -67,6 +70,9 @@ def parse_barcode_csv(input_file: str) -> List[Tuple[str, str]]:
         barcode_col = None
         
         for i, fn in enumerate(fieldnames_lower):
+            if not fn.strip():
+                # blank header cell, e.g. a trailing comma in an Excel export
+                continue
             if 'well' in fn:
                 well_col = reader.fieldnames[i]
             elif 'barcode' in fn or 'name' in fn or 'id' in fn:
@@ -79,8 +85,9 @@ def parse_barcode_csv(input_file: str) -> List[Tuple[str, str]]:
             )
         
         for row in reader:
-            well = row[well_col].strip()
-            barcode_name = row[barcode_col].strip()
+            # short rows leave missing fields as None
+            well = (row[well_col] or '').strip()
+            barcode_name = (row[barcode_col] or '').strip()
             
             if well and barcode_name:
                 barcodes.append((well, barcode_name))
@@ -88,40 +95,47 @@ def parse_barcode_csv(input_file: str) -> List[Tuple[str, str]]:
     return barcodes
 
 
-def generate_heatmap_mapping(
-    input_csv: str,
+def write_heatmap_mapping(
+    barcodes: List[Tuple[str, str]],
     output_csv: str
 ) -> None:
     """
     Generate a heatmap mapping CSV from barcode positions.
     
     Args:
-        input_csv: Input CSV file with barcode positions
+        barcodes: List of tuples (well, barcode_name) from parse_barcode_csv
         output_csv: Output CSV filename for heatmap mapping
     """
-    barcodes = parse_barcode_csv(input_csv)
+    rows = [
+        (barcode_name, well) + well_to_row_col(well)
+        for well, barcode_name in barcodes
+    ]
     
     with open(output_csv, 'w', newline='') as f:
         writer = csv.writer(f)
         writer.writerow(['Barcode_Name', 'Well', 'Row', 'Column', 'Row_Index', 'Column_Index'])
-        
-        for well, barcode_name in barcodes:
-            row_letter, col_number, row_index, col_index = well_to_row_col(well)
-            writer.writerow([
-                barcode_name,
-                well,
-                row_letter,
-                col_number,
-                row_index,
-                col_index
-            ])
+        writer.writerows(rows)
     
     print(f"Generated heatmap mapping: {output_csv}")
     print(f"  Barcodes: {len(barcodes)}")
 
 
-def generate_plate_layout_matrix(
+def generate_heatmap_mapping(
     input_csv: str,
+    output_csv: str
+) -> None:
+    """
+    Generate a heatmap mapping CSV from barcode positions.
+    
+    Args:
+        input_csv: Input CSV file with barcode positions
+        output_csv: Output CSV filename for heatmap mapping
+    """
+    write_heatmap_mapping(parse_barcode_csv(input_csv), output_csv)
+
+
+def write_plate_layout_matrix(
+    barcodes: List[Tuple[str, str]],
     output_csv: str,
     plate_format: int = 384
 ) -> None:
@@ -129,12 +143,10 @@ def generate_plate_layout_matrix(
     Generate a plate layout matrix suitable for direct heatmap plotting.
     
     Args:
-        input_csv: Input CSV file with barcode positions
+        barcodes: List of tuples (well, barcode_name) from parse_barcode_csv
         output_csv: Output CSV filename for plate matrix
         plate_format: Plate format (96 or 384)
     """
-    barcodes = parse_barcode_csv(input_csv)
-    
     # Determine plate dimensions
     if plate_format == 96:
         num_rows, num_cols = 8, 12
@@ -161,15 +173,29 @@ def generate_plate_layout_matrix(
         header = ['Row'] + [str(i+1) for i in range(num_cols)]
         writer.writerow(header)
         
-        # Data rows
-        for i, row in enumerate(matrix):
-            row_letter = chr(ord('A') + i)
-            writer.writerow([row_letter] + row)
+        # Data rows, each prefixed with its row letter
+        writer.writerows([chr(_ORD_A + i)] + row for i, row in enumerate(matrix))
     
     print(f"Generated plate layout matrix: {output_csv}")
     print(f"  Format: {plate_format}-well plate ({num_rows}x{num_cols})")
 
 
+def generate_plate_layout_matrix(
+    input_csv: str,
+    output_csv: str,
+    plate_format: int = 384
+) -> None:
+    """
+    Generate a plate layout matrix suitable for direct heatmap plotting.
+    
+    Args:
+        input_csv: Input CSV file with barcode positions
+        output_csv: Output CSV filename for plate matrix
+        plate_format: Plate format (96 or 384)
+    """
+    write_plate_layout_matrix(parse_barcode_csv(input_csv), output_csv, plate_format)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate heatmap mapping from barcode positions'
@@ -199,13 +225,16 @@ def main():
     
     args = parser.parse_args()
     
+    # Parse the input once and reuse it for every output
+    barcodes = parse_barcode_csv(args.input_csv)
+    
     # Generate coordinate mapping
-    generate_heatmap_mapping(args.input_csv, args.output)
+    write_heatmap_mapping(barcodes, args.output)
     
     # Optionally generate plate matrix
     if args.matrix:
-        generate_plate_layout_matrix(
-            args.input_csv,
+        write_plate_layout_matrix(
+            barcodes,
             args.matrix,
             args.plate_format
         )
@@ -51,6 +51,9 @@ def parse_barcode_csv(input_file: str) -> List[Tuple[str, str, str]]:
         sequence_col = None
         
         for i, fn in enumerate(fieldnames_lower):
+            if not fn.strip():
+                # blank header cell, e.g. a trailing comma in an Excel export
+                continue
             if 'well' in fn:
                 well_col = reader.fieldnames[i]
             elif 'barcode' in fn or 'name' in fn or 'id' in fn:
@@ -65,9 +68,10 @@ def parse_barcode_csv(input_file: str) -> List[Tuple[str, str, str]]:
             )
         
         for row in reader:
-            well = row[well_col].strip()
-            barcode_name = row[barcode_col].strip()
-            sequence = row[sequence_col].strip().upper()
+            # short rows leave missing fields as None
+            well = (row[well_col] or '').strip()
+            barcode_name = (row[barcode_col] or '').strip()
+            sequence = (row[sequence_col] or '').strip().upper()
             
             if well and barcode_name and sequence:
                 barcodes.append((well, barcode_name, sequence))
@@ -75,8 +79,8 @@ def parse_barcode_csv(input_file: str) -> List[Tuple[str, str, str]]:
     return barcodes
 
 
-def generate_minimap_tsv(
-    input_csv: str,
+def write_minimap_tsv(
+    barcodes: List[Tuple[str, str, str]],
     output_tsv: str,
     include_well: bool = False
 ) -> None:
@@ -84,29 +88,41 @@ def generate_minimap_tsv(
     Generate a minimap2-compatible TSV file from barcode CSV.
     
     Args:
-        input_csv: Input CSV file with barcode positions and sequences
+        barcodes: List of tuples (well, barcode_name, sequence) from parse_barcode_csv
         output_tsv: Output TSV filename
         include_well: If True, include well position in barcode name
     """
-    barcodes = parse_barcode_csv(input_csv)
+    rows = [
+        (f"{barcode_name}_{well}" if include_well else barcode_name, sequence)
+        for well, barcode_name, sequence in barcodes
+    ]
     
     with open(output_tsv, 'w', newline='') as f:
         writer = csv.writer(f, delimiter='\t')
-        
-        for well, barcode_name, sequence in barcodes:
-            if include_well:
-                name = f"{barcode_name}_{well}"
-            else:
-                name = barcode_name
-            
-            writer.writerow([name, sequence])
+        writer.writerows(rows)
     
     print(f"Generated minimap TSV: {output_tsv}")
     print(f"  Barcodes: {len(barcodes)}")
 
 
-def generate_fasta(
+def generate_minimap_tsv(
     input_csv: str,
+    output_tsv: str,
+    include_well: bool = False
+) -> None:
+    """
+    Generate a minimap2-compatible TSV file from barcode CSV.
+    
+    Args:
+        input_csv: Input CSV file with barcode positions and sequences
+        output_tsv: Output TSV filename
+        include_well: If True, include well position in barcode name
+    """
+    write_minimap_tsv(parse_barcode_csv(input_csv), output_tsv, include_well)
+
+
+def write_fasta(
+    barcodes: List[Tuple[str, str, str]],
     output_fasta: str,
     include_well: bool = False
 ) -> None:
@@ -114,25 +130,39 @@ def generate_fasta(
     Generate a FASTA file from barcode CSV (alternative format).
     
     Args:
-        input_csv: Input CSV file with barcode positions and sequences
+        barcodes: List of tuples (well, barcode_name, sequence) from parse_barcode_csv
         output_fasta: Output FASTA filename
         include_well: If True, include well position in barcode name
     """
-    barcodes = parse_barcode_csv(input_csv)
+    records = [
+        f">{barcode_name}_{well}\n{sequence}\n" if include_well
+        else f">{barcode_name}\n{sequence}\n"
+        for well, barcode_name, sequence in barcodes
+    ]
     
     with open(output_fasta, 'w') as f:
-        for well, barcode_name, sequence in barcodes:
-            if include_well:
-                name = f"{barcode_name}_{well}"
-            else:
-                name = barcode_name
-            
-            f.write(f">{name}\n{sequence}\n")
+        f.write(''.join(records))
     
     print(f"Generated FASTA file: {output_fasta}")
     print(f"  Barcodes: {len(barcodes)}")
 
 
+def generate_fasta(
+    input_csv: str,
+    output_fasta: str,
+    include_well: bool = False
+) -> None:
+    """
+    Generate a FASTA file from barcode CSV (alternative format).
+    
+    Args:
+        input_csv: Input CSV file with barcode positions and sequences
+        output_fasta: Output FASTA filename
+        include_well: If True, include well position in barcode name
+    """
+    write_fasta(parse_barcode_csv(input_csv), output_fasta, include_well)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate minimap2-compatible TSV from barcode CSV'
@@ -160,12 +190,15 @@ def main():
     
     args = parser.parse_args()
     
+    # Parse the input once and reuse it for every output
+    barcodes = parse_barcode_csv(args.input_csv)
+    
     # Generate TSV
-    generate_minimap_tsv(args.input_csv, args.output, args.include_well)
+    write_minimap_tsv(barcodes, args.output, args.include_well)
     
     # Optionally generate FASTA
     if args.fasta:
-        generate_fasta(args.input_csv, args.fasta, args.include_well)
+        write_fasta(barcodes, args.fasta, args.include_well)
 
 
 if __name__ == '__main__':
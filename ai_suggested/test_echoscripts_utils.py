@@ -0,0 +1,63 @@
+"""Regression tests for EchoTransferGenerator plate assignment."""
+
+import hashlib
+
+import pytest
+
+from echoscripts_utils import EchoTransferGenerator
+
+
+def _csv_sha256(df):
+    return hashlib.sha256(df.to_csv(index=False, lineterminator='\n').encode()).hexdigest()
+
+
+# Plates produced by the original np.random.seed/randint notebooks code. A seed
+# must keep reproducing the plate saved as helloPrimersRand{randseed}.csv.
+@pytest.mark.parametrize("randseed, volume_nl, digest", [
+    (250513, 750, "09c090a70bdf99b79732550cc824937adacc44c2ca6d3924a739ddc9676aab7c"),
+    (250807, 500, "6659566b65772c9075556fa746c2af2a5a2872c1c3a581a0fe976bc77cd3392a"),
+])
+def test_legacy_rng_reproduces_notebook_plate(randseed, volume_nl, digest):
+    df = EchoTransferGenerator(randseed).generate_transfer_df(volume_nl=volume_nl)
+
+    assert _csv_sha256(df) == digest
+
+
+def test_legacy_rng_first_rows():
+    df = EchoTransferGenerator(250513).generate_transfer_df(volume_nl=750)
+
+    assert df.head(6).values.tolist() == [
+        ['M19', 'A1', 750], ['P10', 'A1', 750],
+        ['I11', 'A2', 750], ['L22', 'A2', 750],
+        ['I9', 'A3', 750], ['P4', 'A3', 750],
+    ]
+
+
+def test_generator_rng_draws_distinct_off_diagonal_pairs():
+    generator = EchoTransferGenerator(250513, legacy_rng=False)
+    fprimers, rprimers = generator.sample_primers()
+    df = generator.generate_transfer_df()
+
+    fwd_index = {well: i for i, well in enumerate(fprimers)}
+    rev_index = {well: i for i, well in enumerate(rprimers)}
+    pairs = [
+        (fwd_index[fwd], rev_index[rev])
+        for fwd, rev in zip(df['Source Well'][0::2], df['Source Well'][1::2])
+    ]
+
+    assert len(pairs) == 384
+    assert len(set(pairs)) == 384
+    assert all(iforward != ireverse for iforward, ireverse in pairs)
+    assert df.equals(generator.generate_transfer_df())
+
+
+@pytest.mark.parametrize("legacy_rng", [True, False])
+def test_write_transfer_csv_matches_dataframe_to_csv(tmp_path, legacy_rng):
+    generator = EchoTransferGenerator(250513, legacy_rng=legacy_rng)
+    written = tmp_path / "written.csv"
+    expected = tmp_path / "expected.csv"
+
+    generator.write_transfer_csv(str(written), volume_nl=750)
+    generator.generate_transfer_df(volume_nl=750).to_csv(str(expected), index=False, lineterminator='\n')
+
+    assert written.read_bytes() == expected.read_bytes()
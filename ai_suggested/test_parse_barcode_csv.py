@@ -0,0 +1,87 @@
+"""Regression tests for parse_barcode_csv column detection."""
+
+import generate_heatmap_mapping
+import generate_minimap_tsv
+
+
+TRAILING_COMMA_CSV = (
+    "Well,Barcode_Name,Sequence,\n"
+    "A1,BC01,acgt,\n"
+    "A2,BC02,TTGA,\n"
+)
+
+BLANK_MIDDLE_COLUMN_CSV = (
+    "Well,,Barcode_Name,Sequence\n"
+    "A1,x,BC01,acgt\n"
+    "A2,y,BC02,TTGA\n"
+)
+
+# first data row has one more field than the header (trailing comma)
+TRAILING_COMMA_ROW_CSV = (
+    "Well,Barcode_Name,Sequence\n"
+    "A1,12,AC,\n"
+    "A2,13,GT\n"
+)
+
+TRAILING_COMMA_ROW_EXTRA_COLUMN_CSV = (
+    "Well,Barcode_Name,Sequence,Notes\n"
+    "A1,BC1,acgt,n,\n"
+    "A2,BC2,ttga,m\n"
+)
+
+
+def test_minimap_parse_ignores_trailing_comma_header(tmp_path):
+    path = tmp_path / "barcodes.csv"
+    path.write_text(TRAILING_COMMA_CSV)
+
+    barcodes = generate_minimap_tsv.parse_barcode_csv(str(path))
+
+    assert barcodes == [
+        ("A1", "BC01", "ACGT"),
+        ("A2", "BC02", "TTGA"),
+    ]
+
+
+def test_minimap_parse_ignores_blank_header_column(tmp_path):
+    path = tmp_path / "barcodes.csv"
+    path.write_text(BLANK_MIDDLE_COLUMN_CSV)
+
+    barcodes = generate_minimap_tsv.parse_barcode_csv(str(path))
+
+    assert [barcode_name for _, barcode_name, _ in barcodes] == ["BC01", "BC02"]
+
+
+def test_heatmap_parse_ignores_trailing_comma_header(tmp_path):
+    path = tmp_path / "barcodes.csv"
+    path.write_text(TRAILING_COMMA_CSV)
+
+    barcodes = generate_heatmap_mapping.parse_barcode_csv(str(path))
+
+    assert barcodes == [
+        ("A1", "BC01"),
+        ("A2", "BC02"),
+    ]
+
+
+def test_minimap_parse_keeps_columns_aligned_with_trailing_comma_row(tmp_path):
+    path = tmp_path / "barcodes.csv"
+    path.write_text(TRAILING_COMMA_ROW_EXTRA_COLUMN_CSV)
+
+    barcodes = generate_minimap_tsv.parse_barcode_csv(str(path))
+
+    assert barcodes == [
+        ("A1", "BC1", "ACGT"),
+        ("A2", "BC2", "TTGA"),
+    ]
+
+
+def test_heatmap_parse_keeps_columns_aligned_with_trailing_comma_row(tmp_path):
+    path = tmp_path / "barcodes.csv"
+    path.write_text(TRAILING_COMMA_ROW_CSV)
+
+    barcodes = generate_heatmap_mapping.parse_barcode_csv(str(path))
+
+    assert barcodes == [
+        ("A1", "12"),
+        ("A2", "13"),
+    ]